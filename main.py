@@ -1,21 +1,94 @@
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Literal
+from typing import Literal, get_args
 
-from pydantic import BaseModel
 from reportlab.lib.colors import black, lightgrey
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-
-pdfmetrics.registerFont(TTFont("Yrsa", "fonts/yrsa/Yrsa-Light.ttf"))
-pdfmetrics.registerFont(TTFont("YrsaBold", "fonts/yrsa/Yrsa-SemiBold.ttf"))
-pdfmetrics.registerFont(TTFont("YrsaItalic", "fonts/yrsa/Yrsa-LightItalic.ttf"))
-pdfmetrics.registerFont(TTFont("YrsaBoldItalic", "fonts/yrsa/Yrsa-SemiBoldItalic.ttf"))
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    BaseDocTemplate,
+    Flowable,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+__all__ = [
+    "PDFInvoiceWriter",
+    "Client",
+    "LawFirm",
+    "Fees",
+    "Time",
+    "FontStyle",
+    "Alignment",
+    "FastInvoiceWriter",
+    "render_many",
+]
+
+FONT_BASE = "Yrsa"
+FONT_BOLD = "YrsaBold"
+FONT_ITALIC = "YrsaItalic"
+FONT_BOLD_ITALIC = "YrsaBoldItalic"
+
+# Page width minus SimpleDocTemplate's default 1 inch left and right margins
+AVAILABLE_WIDTH = letter[0] - 2 * inch
+# Empty, description, time and price columns of the fee table
+FEE_COL_WIDTHS = (
+    AVAILABLE_WIDTH * 0.15,
+    AVAILABLE_WIDTH * 0.55,
+    AVAILABLE_WIDTH * 0.15,
+    AVAILABLE_WIDTH * 0.15,
+)
+# Empty first column, then label (70%) and value (30%) of the remaining width
+TOTAL_COL_WIDTHS = (
+    AVAILABLE_WIDTH * 0.10,
+    AVAILABLE_WIDTH * 0.90 * 0.70,
+    AVAILABLE_WIDTH * 0.90 * 0.30,
+)
+
+# Line height of the Normal paragraph style, also the base unit for spacers
+LEADING = 12
+# Default paddings of SimpleDocTemplate's frame and of Table cells
+FRAME_PADDING = 6
+CELL_H_PADDING = 6
+CELL_V_PADDING = 3
+
+# Fixed wording of the invoice, shared by both writers
+COLLABORATION_HEADING = "En collaboration avec :"
+FEES_HEADING = "Honoraires"
+SERVICES_HEADING = "Diligences effectuées :"
+VAT_NOTICE = "TVA Applicable -"
+PAYMENT_REQUEST = "En votre aimable règlement"
+PAYMENT_TERMS = "<u>Conformément à nos usages de professions libérales, la présente est payable dès réception</u>"
+# Printed on every invoice until they become writer arguments
+INVOICE_PLACE = "Paris"
+INVOICE_NUMBER = "2025-121"
+
+_FONTS_REGISTERED = False
+
+
+def _ensure_fonts() -> None:
+    """Registers the Yrsa TTF fonts with ReportLab, once per process."""
+    global _FONTS_REGISTERED
+    if _FONTS_REGISTERED:
+        return
+    pdfmetrics.registerFont(TTFont(FONT_BASE, "fonts/yrsa/Yrsa-Light.ttf"))
+    pdfmetrics.registerFont(TTFont(FONT_BOLD, "fonts/yrsa/Yrsa-SemiBold.ttf"))
+    pdfmetrics.registerFont(TTFont(FONT_ITALIC, "fonts/yrsa/Yrsa-LightItalic.ttf"))
+    pdfmetrics.registerFont(
+        TTFont(FONT_BOLD_ITALIC, "fonts/yrsa/Yrsa-SemiBoldItalic.ttf")
+    )
+    _FONTS_REGISTERED = True
 
 
 class FontStyle(Enum):
@@ -25,20 +98,22 @@ class FontStyle(Enum):
     BOLD_ITALIC = "bold_italic"
 
 
-MONTH_TO_FRENCH = {
-    1: "janvier",
-    2: "février",
-    3: "mars",
-    4: "avril",
-    5: "mai",
-    6: "juin",
-    7: "juillet",
-    8: "août",
-    9: "septembre",
-    10: "octobre",
-    11: "novembre",
-    12: "décembre",
-}
+# Indexed by month number, index 0 is unused
+MONTH_TO_FRENCH = (
+    "",
+    "janvier",
+    "février",
+    "mars",
+    "avril",
+    "mai",
+    "juin",
+    "juillet",
+    "août",
+    "septembre",
+    "octobre",
+    "novembre",
+    "décembre",
+)
 
 
 class Alignment(Enum):
@@ -48,15 +123,38 @@ class Alignment(Enum):
     JUSTIFY = "justify"
 
 
-class Client(BaseModel):
+FONT_MAP = {
+    FontStyle.BASE: FONT_BASE,
+    FontStyle.BOLD: FONT_BOLD,
+    FontStyle.ITALIC: FONT_ITALIC,
+    FontStyle.BOLD_ITALIC: FONT_BOLD_ITALIC,
+}
+ALIGN_MAP = {
+    Alignment.LEFT: TA_LEFT,
+    Alignment.RIGHT: TA_RIGHT,
+    Alignment.CENTER: TA_CENTER,
+    Alignment.JUSTIFY: TA_JUSTIFY,
+}
+
+
+Gender = Literal["M", "F"]
+
+
+@dataclass(slots=True)
+class Client:
     name: str
-    gender: Literal["M", "F"]
+    gender: Gender
     city: str
     zip_code: str
     adress: str
 
+    def __post_init__(self) -> None:
+        if self.gender not in get_args(Gender):
+            raise ValueError(f"Invalid gender: {self.gender}")
+
 
-class LawFirm(BaseModel):
+@dataclass(slots=True)
+class LawFirm:
     principal_lawyer: str
     collaborators: list[str]
     zip_code: str
@@ -70,81 +168,131 @@ class LawFirm(BaseModel):
     siret_number: str
 
 
-class Time(BaseModel):
+@dataclass(slots=True)
+class Time:
     description: str
     duration: timedelta
     date: date
 
 
-class Fees(BaseModel):
+@dataclass(slots=True)
+class Fees:
     times: list[Time]
     price: float
 
+    def __post_init__(self) -> None:
+        # Keeps `price=300` rendering as "300.0" in the hourly rate line
+        self.price = float(self.price)
 
-class PDFInvoiceWriter:
-    font_base = "Yrsa"
-    font_bold = "YrsaBold"
-    font_italic = "YrsaItalic"
-    font_bold_italic = "YrsaBoldItalic"
 
-    def __init__(self, output_path: str, client: Client, lawfirm: LawFirm, fees: Fees):
-        self.output_path = output_path
-        self.client = client
-        self.lawfirm = lawfirm
-        self.fees = fees
-        self.doc = SimpleDocTemplate(output_path, pagesize=letter)
-        self.styles = getSampleStyleSheet()
+# (time, hours, minutes, price) for one fee, and (rows, total_seconds, ht_price)
+FeeRow = tuple[Time, float, float, float]
+FeeSummary = tuple[list[FeeRow], float, float]
+# (output_path, client, lawfirm, fees) describing one invoice to render
+InvoiceJob = tuple[str, Client, LawFirm, Fees]
 
-        # Generates an empty story
-        self.contents = []
 
-    def font_from_style(self, style: FontStyle):
-        match style:
-            case FontStyle.BASE:
-                return self.font_base
-            case FontStyle.BOLD:
-                return self.font_bold
-            case FontStyle.ITALIC:
-                return self.font_italic
-            case FontStyle.BOLD_ITALIC:
-                return self.font_bold_italic
-            case _:
-                raise ValueError(f"Invalid font style: {style}")
-
-    def _draw_footer(self, canvas, doc):
-        """Draws the footer on each page."""
-        canvas.saveState()
+def _compute_fee_summary(fees: Fees) -> FeeSummary:
+    """Computes (rows, total_seconds, ht_price) in a single pass over the fees.
 
-        footer_style = self.style(font_size=9, alignment=Alignment.CENTER)
-        y_position = doc.bottomMargin / 2  # Center vertically in the bottom margin
+    Each row is a (time, hours, minutes, price) tuple.
+    """
+    rows = []
+    total_seconds = 0.0
+    ht_price = 0.0
+    for time in fees.times:
+        seconds = time.duration.total_seconds()
+        price = seconds / 3600 * fees.price
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        rows.append((time, hours, minutes, price))
+        total_seconds += seconds
+        ht_price += price
 
-        # Line 1: Address, City, Zip
-        line1_text = (
-            f"{self.lawfirm.adress} {self.lawfirm.zip_code} {self.lawfirm.city}"
-        )
-        p1 = Paragraph(line1_text, footer_style)
-        w1, h1 = p1.wrap(doc.width, doc.bottomMargin)
-        p1.drawOn(canvas, doc.leftMargin, y_position + h1 * 1.5)  # Position lines
+    return rows, total_seconds, ht_price
 
-        # Line 2: Phone, Mail, Website
-        line2_text = f"Tel : {self.lawfirm.phone} - Mail : {self.lawfirm.mail} - Site : {self.lawfirm.website}"
-        p2 = Paragraph(line2_text, footer_style)
-        w2, h2 = p2.wrap(doc.width, doc.bottomMargin)
-        p2.drawOn(
-            canvas, doc.leftMargin, y_position + h1 * 0.5
-        )  # Position below line 1
-
-        # Line 3: VAT, SIRET
-        line3_text = f"TVA Intracommunautaire : {self.lawfirm.vat_number} - SIRET : {self.lawfirm.siret_number}"
-        p3 = Paragraph(line3_text, footer_style)
-        w3, h3 = p3.wrap(doc.width, doc.bottomMargin)
-        p3.drawOn(
-            canvas, doc.leftMargin, y_position - h2 * 0.5
-        )  # Position below line 2
 
-        canvas.restoreState()
+def _court_title(lawyer_count: int = 1) -> str:
+    return "Avocate{} à la Cour".format("s" if lawyer_count > 1 else "")
+
+
+def _client_address_lines(client: Client) -> tuple[str, str, str]:
+    title = "Monsieur" if client.gender == "M" else "Madame"
+    return (
+        f"{title} {client.name}",
+        client.adress,
+        f"{client.zip_code} {client.city}",
+    )
+
+
+def _date_text(place: str, when: datetime) -> str:
+    return f"{place}, le {when.day} {MONTH_TO_FRENCH[when.month]} {when.year}"
+
+
+def _invoice_title(number: str) -> str:
+    return f"FACTURE N°{number}"
+
+
+def _hourly_rate_text(price: float) -> str:
+    return f"Facturation horaire : {price} euros HT de l'heure (selon l'article 2.1 du contrat de mission)"
+
+
+def _fee_cells(row: FeeRow) -> tuple[str, str, str]:
+    """Returns the description, duration and price cells of one fee row."""
+    time, hours, minutes, price = row
+    return (
+        f"{time.description} ({time.date.strftime('%d/%m/%Y')})",
+        f"{hours:02.0f}:{minutes:02.0f}",
+        f"{price:.2f} €",
+    )
+
+
+def _total_rows(total_seconds: float, ht_price: float) -> list[tuple[str, str]]:
+    """Returns the (label, value) rows of the total table, total time first."""
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    vat = ht_price * 0.20
+    ttc_price = ht_price + vat
+    return [
+        (f"Soit un total de {hours:02.0f}h{minutes:02.0f}", ""),
+        ("Honoraires H.T.", f"{ht_price:.2f} €"),
+        ("TVA 20%", f"{vat:.2f} €"),
+        ("TOTAL T.T.C. DU", f"{ttc_price:.2f} €"),
+    ]
+
+
+def _footer_texts(lawfirm: LawFirm) -> tuple[str, str, str]:
+    """Returns the footer lines: address, contact details, then VAT and SIRET."""
+    return (
+        f"{lawfirm.adress} {lawfirm.zip_code} {lawfirm.city}",
+        f"Tel : {lawfirm.phone} - Mail : {lawfirm.mail} - Site : {lawfirm.website}",
+        f"TVA Intracommunautaire : {lawfirm.vat_number} - SIRET : {lawfirm.siret_number}",
+    )
+
+
+class _InvoiceLayout(ABC):
+    """Order and spacing of the invoice sections, shared by both writers.
+
+    Subclasses decide how each section is drawn.
+    """
+
+    __slots__ = ("output_path", "client", "lawfirm", "fees")
+
+    output_path: str
+    client: Client
+    lawfirm: LawFirm
+    fees: Fees
+
+    def __init__(
+        self, output_path: str, client: Client, lawfirm: LawFirm, fees: Fees
+    ) -> None:
+        _ensure_fonts()
+        self.output_path = output_path
+        self.client = client
+        self.lawfirm = lawfirm
+        self.fees = fees
 
-    def build(self):
+    def _add_sections(self) -> None:
         self.lawyer_title(self.lawfirm.principal_lawyer)
         self.spacer(1.5)
         if self.lawfirm.collaborators:
@@ -152,21 +300,135 @@ class PDFInvoiceWriter:
             self.spacer(1)
         self.client_address(self.client)
         self.spacer(3)
-        self.place_and_date("Paris", datetime.now())
+        self.place_and_date(INVOICE_PLACE, datetime.now())
         self.spacer(0.5)
-        self.invoice_number_rectangle("2025-121")
+        self.invoice_number_rectangle(INVOICE_NUMBER)
         self.spacer(2)
         self.detail_fees()
         self.spacer(2)
         self.final()
 
+    @abstractmethod
+    def spacer(self, height: float, base_height: float = LEADING) -> None: ...
+
+    @abstractmethod
+    def lawyer_title(self, name: str) -> None: ...
+
+    @abstractmethod
+    def collaborator_title(self, names: list[str]) -> None: ...
+
+    @abstractmethod
+    def client_address(self, client: Client) -> None: ...
+
+    @abstractmethod
+    def place_and_date(self, place: str, date: datetime) -> None: ...
+
+    @abstractmethod
+    def invoice_number_rectangle(self, number: str) -> None: ...
+
+    @abstractmethod
+    def detail_fees(self) -> None: ...
+
+    @abstractmethod
+    def final(self) -> None: ...
+
+
+class PDFInvoiceWriter(_InvoiceLayout):
+    __slots__ = (
+        "doc",
+        "styles",
+        "contents",
+        "_style_cache",
+        "_fee_cache",
+        "_footer_lines",
+    )
+
+    # Table styles only hold constant commands, so they're parsed once at import
+    _INVOICE_BOX_STYLE = TableStyle(
+        [
+            ("BOX", (0, 0), (-1, -1), 1, black),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ]
+    )
+    _FEE_TABLE_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),  # Reduce top padding
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),  # Reduce bottom padding
+            ("FONTNAME", (0, 0), (-1, -1), FONT_BOLD),
+            ("FONTSIZE", (0, 0), (-1, -1), 12),
+            ("ALIGN", (2, 0), (3, -1), "RIGHT"),
+        ]
+    )
+    # Basic style: no grid lines, vertical alignment
+    _TOTAL_TABLE_STYLE = TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("BACKGROUND", (0, -1), (2, -1), lightgrey),
+        ]
+    )
+
+    # Instance attributes are declared up front so the class can be compiled
+    # with mypyc, which requires a fixed attribute layout
+    doc: SimpleDocTemplate
+    styles: StyleSheet1
+    contents: list[Flowable]
+    _style_cache: dict[tuple[Alignment, FontStyle, float], ParagraphStyle]
+    _fee_cache: FeeSummary | None
+    _footer_lines: list[tuple[Paragraph, float]]
+
+    def __init__(
+        self, output_path: str, client: Client, lawfirm: LawFirm, fees: Fees
+    ) -> None:
+        super().__init__(output_path, client, lawfirm, fees)
+        self.doc = SimpleDocTemplate(output_path, pagesize=letter)
+        self.styles = getSampleStyleSheet()
+        self._style_cache = {}
+        self._fee_cache = None
+        self._footer_lines = self._build_footer_lines()
+
+        # Generates an empty story
+        self.contents = []
+
+    def font_from_style(self, style: FontStyle) -> str:
+        try:
+            return FONT_MAP[style]
+        except KeyError:
+            raise ValueError(f"Invalid font style: {style}") from None
+
+    def _build_footer_lines(self) -> list[tuple[Paragraph, float]]:
+        """Builds and wraps the footer paragraphs once, as they're constant for the document."""
+        footer_style = self.style(font_size=9, alignment=Alignment.CENTER)
+        footer_lines = []
+        for text in _footer_texts(self.lawfirm):
+            paragraph = Paragraph(text, footer_style)
+            _, height = paragraph.wrap(self.doc.width, self.doc.bottomMargin)
+            footer_lines.append((paragraph, height))
+        return footer_lines
+
+    def _draw_footer(self, canvas: Canvas, doc: BaseDocTemplate) -> None:
+        """Draws the footer on each page."""
+        canvas.saveState()
+
+        y_position = doc.bottomMargin / 2  # Center vertically in the bottom margin
+        (p1, h1), (p2, h2), (p3, _) = self._footer_lines
+
+        p1.drawOn(canvas, doc.leftMargin, y_position + h1 * 1.5)  # Position lines
+        p2.drawOn(canvas, doc.leftMargin, y_position + h1 * 0.5)  # Below line 1
+        p3.drawOn(canvas, doc.leftMargin, y_position - h2 * 0.5)  # Below line 2
+
+        canvas.restoreState()
+
+    def build(self) -> None:
+        self._add_sections()
+
         # Build the document using the footer drawing callback
         self.doc.build(
             self.contents, onFirstPage=self._draw_footer, onLaterPages=self._draw_footer
         )
         print(f"ReportLab PDF '{self.output_path}' generated successfully.")
 
-    def spacer(self, height: float, base_height: float = 12):
+    def spacer(self, height: float, base_height: float = 12) -> None:
         """Adds a spacer to the document."""
         self.contents.append(Spacer(1, base_height * height))
 
@@ -176,213 +438,138 @@ class PDFInvoiceWriter:
         font_style: FontStyle = FontStyle.BASE,
         font_size: float = 12,
     ) -> ParagraphStyle:
-        style_name = f"{alignment.value}_{font_style.value}"
+        key = (alignment, font_style, font_size)
+        if key in self._style_cache:
+            return self._style_cache[key]
+
+        style_name = f"{alignment.value}_{font_style.value}_{font_size}"
 
         # If not in cache, create, store, and return
         style = ParagraphStyle(style_name, parent=self.styles["Normal"])
         # Convert Alignment enum to ReportLab constant for alignment
-        if alignment == Alignment.LEFT:
-            style.alignment = TA_LEFT
-        elif alignment == Alignment.RIGHT:
-            style.alignment = TA_RIGHT
-        elif alignment == Alignment.CENTER:
-            style.alignment = TA_CENTER
-        elif alignment == Alignment.JUSTIFY:
-            style.alignment = TA_JUSTIFY
+        style.alignment = ALIGN_MAP[alignment]
 
         style.fontName = self.font_from_style(font_style)
         style.fontSize = font_size
+        self._style_cache[key] = style
         return style
 
-    def lawyer_title(self, name):
+    def lawyer_title(self, name: str) -> None:
         """Adds a centered paragraph with the main's lawyer name"""
-        # Create a copy of the style to avoid modifying the original
-        self.contents.append(
-            Paragraph(name, self.style(Alignment.CENTER, FontStyle.BOLD, font_size=16))
-        )
+        bold = self.style(Alignment.CENTER, FontStyle.BOLD, font_size=16)
+        base = self.style(Alignment.CENTER, font_size=16)
+
+        self.contents.append(Paragraph(name, bold))
         self.spacer(0.3)
-        self.contents.append(
-            Paragraph("Avocate à la Cour", self.style(Alignment.CENTER, font_size=16))
-        )
+        self.contents.append(Paragraph(_court_title(), base))
 
-    def collaborator_title(self, names: list[str]):
+    def collaborator_title(self, names: list[str]) -> None:
         """Adds a left-aligned paragraph with the lawyer's collaborators"""
-        self.contents.append(
-            Paragraph(
-                "En collaboration avec :", self.style(Alignment.LEFT, FontStyle.ITALIC)
-            )
-        )
-
-        for name in names:
-            self.contents.append(Paragraph(name, self.style(Alignment.LEFT)))
-
-        self.contents.append(
-            Paragraph(
-                "Avocate{} à la Cour".format("s" if len(names) > 1 else ""),
-                self.style(Alignment.LEFT),
-            )
+        # A single multi-line paragraph is laid out once instead of once per name
+        lines = [*names, _court_title(len(names))]
+        self.contents.extend(
+            [
+                Paragraph(
+                    COLLABORATION_HEADING,
+                    self.style(Alignment.LEFT, FontStyle.ITALIC),
+                ),
+                Paragraph("<br/>".join(lines), self.style(Alignment.LEFT)),
+            ]
         )
 
-    def client_address(self, client: Client):
+    def client_address(self, client: Client) -> None:
         # Use bold style for the name line
         style = self.style(Alignment.RIGHT, FontStyle.BOLD)
-        title = "Monsieur" if client.gender == "M" else "Madame"
+        lines = _client_address_lines(client)
+        self.contents.append(Paragraph("<br/>".join(lines), style))
 
-        self.contents.append(Paragraph(f"{title} {client.name}", style))
-        self.contents.append(Paragraph(f"{client.adress}", style))
-        self.contents.append(Paragraph(f"{client.zip_code} {client.city}", style))
-
-    def invoice_number_rectangle(self, number: str):
+    def invoice_number_rectangle(self, number: str) -> None:
         """Shows the invoice number in a rectangle of the width of the page."""
 
-        text = f"FACTURE N°{number}"
+        text = _invoice_title(number)
         p = Paragraph(text, self.style(Alignment.CENTER, FontStyle.BOLD))
 
-        available_width = letter[0] - 2 * inch
         data = [[p]]
-        table = Table(data, colWidths=[available_width], rowHeights=[0.5 * inch])
-        ts = TableStyle(
-            [
-                ("BOX", (0, 0), (-1, -1), 1, black),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ]
-        )
-        table.setStyle(ts)
+        table = Table(data, colWidths=[AVAILABLE_WIDTH], rowHeights=[0.5 * inch])
+        table.setStyle(self._INVOICE_BOX_STYLE)
 
         self.contents.append(table)
 
-    def place_and_date(self, place: str, date: datetime):
+    def place_and_date(self, place: str, date: datetime) -> None:
         """Adds a date to the document."""
         self.contents.append(
-            Paragraph(
-                f"{place}, le {date.day} {MONTH_TO_FRENCH[date.month]} {date.year}",
-                self.style(Alignment.RIGHT),
-            )
+            Paragraph(_date_text(place, date), self.style(Alignment.RIGHT))
         )
 
-    def list_fee_table(self):
+    def _compute_fee_rows(self) -> FeeSummary:
+        """Returns the fee summary, cached so the fee table and the total table
+        share the same computation."""
+        if self._fee_cache is None:
+            self._fee_cache = _compute_fee_summary(self.fees)
+        return self._fee_cache
+
+    def list_fee_table(self) -> None:
         """Shows the list of individual fees"""
+        rows, _, _ = self._compute_fee_rows()
+        # Only the description may need wrapping, so it is the only Paragraph;
+        # other cells are plain strings styled through the TableStyle, which is
+        # much cheaper to lay out
+        description_style = self.style(Alignment.LEFT, FontStyle.BOLD)
         data = []
-        for time in self.fees.times:
-            price = time.duration.total_seconds() / 3600 * self.fees.price
-            hours = time.duration.total_seconds() // 3600
-            minutes = (time.duration.total_seconds() % 3600) // 60
-
+        for row in rows:
+            description, duration, price = _fee_cells(row)
             data.append(
-                [
-                    Paragraph(f"", self.style()),
-                    Paragraph(
-                        f"{time.description} ({time.date.strftime('%d/%m/%Y')})",
-                        self.style(Alignment.LEFT, FontStyle.BOLD),
-                    ),
-                    Paragraph(
-                        f"{hours:02.0f}:{minutes:02.0f}",
-                        self.style(Alignment.RIGHT, FontStyle.BOLD),
-                    ),
-                    Paragraph(
-                        f"{price:.2f} €", self.style(Alignment.RIGHT, FontStyle.BOLD)
-                    ),
-                ]
+                ["", Paragraph(description, description_style), duration, price]
             )
 
-        available_width = letter[0] - 2 * inch
-
-        before_width = available_width * 0.15
-        description_width = available_width * 0.55
-        time_width = available_width * 0.15
-        price_width = available_width * 0.15
-
         table = Table(
             data,
-            colWidths=[before_width, description_width, time_width, price_width],
+            colWidths=FEE_COL_WIDTHS,
             rowHeights=[12] * len(data),  # Reduce row height to 12 points
         )
-        ts = TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),  # Reduce top padding
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),  # Reduce bottom padding
-            ]
-        )
-        table.setStyle(ts)
+        table.setStyle(self._FEE_TABLE_STYLE)
 
         self.contents.append(table)
 
-    def show_total(self):
+    def show_total(self) -> None:
         """Shows the total of the fees in a 4-row table."""
-        ht_price = sum(
-            time.duration.total_seconds() / 3600 * self.fees.price
-            for time in self.fees.times
-        )
-        total_time_seconds = sum(
-            time.duration.total_seconds() for time in self.fees.times
-        )
-        hours = total_time_seconds // 3600
-        minutes = (total_time_seconds % 3600) // 60
-        vat = ht_price * 0.20
-        ttc_price = ht_price + vat
+        _, total_time_seconds, ht_price = self._compute_fee_rows()
 
         # Define styles for the total table
         label_style = self.style(Alignment.LEFT, FontStyle.BOLD)
         value_style = self.style(Alignment.RIGHT, FontStyle.BOLD)
         empty_style = self.style()  # For the empty first column cell
 
-        data = [
-            [
-                Paragraph("", empty_style),  # Empty first cell
-                Paragraph(
-                    f"<u>Soit un total de {hours:02.0f}h{minutes:02.0f}</u>",
-                    label_style,
-                ),
-                Paragraph("", value_style),
-            ],
-            [
-                Paragraph("", empty_style),  # Empty first cell
-                Paragraph("Honoraires H.T.", label_style),
-                Paragraph(f"{ht_price:.2f} €", value_style),
-            ],
-            [
-                Paragraph("", empty_style),  # Empty first cell
-                Paragraph("TVA 20%", label_style),
-                Paragraph(f"{vat:.2f} €", value_style),
-            ],
-            [
-                Paragraph("", empty_style),  # Empty first cell
-                Paragraph("TOTAL T.T.C. DU", label_style),
-                Paragraph(f"{ttc_price:.2f} €", value_style),
-            ],
-        ]
-
-        # Calculate available width and split for the three columns
-        available_width = letter[0] - 2 * inch
-        col0_width = available_width * 0.10  # Empty first column
-        remaining_width = available_width * 0.90
-        col1_width = remaining_width * 0.70  # Label column (70% of remaining)
-        col2_width = remaining_width * 0.30  # Value column (30% of remaining)
+        data = []
+        for index, (label, value) in enumerate(
+            _total_rows(total_time_seconds, ht_price)
+        ):
+            if index == 0:
+                label = f"<u>{label}</u>"  # The total time is underlined
+            data.append(
+                [
+                    Paragraph("", empty_style),  # Empty first cell
+                    Paragraph(label, label_style),
+                    Paragraph(value, value_style),
+                ]
+            )
 
-        total_table = Table(data, colWidths=[col0_width, col1_width, col2_width])
+        total_table = Table(data, colWidths=TOTAL_COL_WIDTHS)
 
-        # Basic style: no grid lines, vertical alignment
-        ts = TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("BACKGROUND", (0, -1), (2, -1), lightgrey),
-            ]
-        )
-        total_table.setStyle(ts)
+        total_table.setStyle(self._TOTAL_TABLE_STYLE)
 
         self.contents.append(total_table)
 
-    def detail_fees(self):
+    def detail_fees(self) -> None:
         fees_style = self.style(font_style=FontStyle.BOLD)
-        self.contents.append(Paragraph(f"<u>Honoraires</u>", fees_style))
+        self.contents.append(Paragraph(f"<u>{FEES_HEADING}</u>", fees_style))
         self.spacer(1)
 
-        hourly_price_txt = f"Facturation horaire : {self.fees.price} euros HT de l'heure (selon l'article 2.1 du contrat de mission)"
+        hourly_price_txt = _hourly_rate_text(self.fees.price)
         self.contents.append(Paragraph(hourly_price_txt, fees_style))
         self.spacer(1)
 
-        self.contents.append(Paragraph("Diligences effectuées :", fees_style))
+        self.contents.append(Paragraph(SERVICES_HEADING, fees_style))
         self.spacer(1)
 
         self.list_fee_table()
@@ -390,26 +577,315 @@ class PDFInvoiceWriter:
         self.spacer(5)
         self.show_total()
 
-    def final(self):
-        self.contents.append(
-            Paragraph("TVA Applicable -", self.style(font_style=FontStyle.ITALIC))
+    def final(self) -> None:
+        italic = self.style(font_style=FontStyle.ITALIC)
+        bold = self.style(font_style=FontStyle.BOLD)
+        base = self.style()
+
+        self.contents.extend(
+            [
+                Paragraph(VAT_NOTICE, italic),
+                Paragraph(PAYMENT_REQUEST, bold),
+            ]
         )
-        self.contents.append(
-            Paragraph(
-                "En votre aimable règlement", self.style(font_style=FontStyle.BOLD)
+        self.spacer(1)
+
+        self.contents.append(Paragraph(PAYMENT_TERMS, base))
+
+
+class FastInvoiceWriter(_InvoiceLayout):
+    """Draws the invoice directly on a canvas, without Platypus flowables.
+
+    The invoice layout is fixed, so every position is computed up front
+    instead of going through Platypus' wrap/layout/draw passes. The result
+    matches PDFInvoiceWriter's layout; Paragraph is only used for text that
+    has to wrap.
+    """
+
+    __slots__ = ("canvas", "y", "_wrap_styles", "_footer_texts")
+
+    canvas: Canvas
+    y: float
+    _wrap_styles: dict[tuple[Alignment, FontStyle, float], ParagraphStyle]
+    _footer_texts: tuple[str, str, str]
+
+    # Text box of the frame used by SimpleDocTemplate, inside its padding
+    _LEFT_X = inch + FRAME_PADDING
+    _RIGHT_X = letter[0] - inch - FRAME_PADDING
+    _CENTER_X = letter[0] / 2
+    _TOP_Y = letter[1] - inch - FRAME_PADDING
+    _BOTTOM_Y = inch + FRAME_PADDING
+    _TEXT_WIDTH = AVAILABLE_WIDTH - 2 * FRAME_PADDING
+
+    _INVOICE_BOX_HEIGHT = 0.5 * inch
+    _FEE_ROW_HEIGHT = LEADING
+    _TOTAL_ROW_HEIGHT = LEADING + 2 * CELL_V_PADDING
+    # Footer line offsets from the middle of the bottom margin, in leadings
+    _FOOTER_OFFSETS = (1.5, 0.5, -0.5)
+
+    def __init__(
+        self, output_path: str, client: Client, lawfirm: LawFirm, fees: Fees
+    ) -> None:
+        super().__init__(output_path, client, lawfirm, fees)
+        self.y = self._TOP_Y
+        self._wrap_styles = {}
+        self._footer_texts = _footer_texts(lawfirm)
+
+    def build(self) -> None:
+        self.canvas = Canvas(self.output_path, pagesize=letter)
+        self.y = self._TOP_Y
+        self._draw_footer()
+        self._add_sections()
+        self.canvas.save()
+        print(f"ReportLab PDF '{self.output_path}' generated successfully.")
+
+    def _draw_footer(self) -> None:
+        """Draws the footer on the current page, before its content like Platypus does."""
+        font_size = 9
+        y_position = inch / 2  # Center vertically in the bottom margin
+
+        self.canvas.setFont(FONT_BASE, font_size)
+        for text, offset in zip(self._footer_texts, self._FOOTER_OFFSETS):
+            baseline = y_position + offset * LEADING + LEADING - font_size
+            self.canvas.drawCentredString(self._CENTER_X, baseline, text)
+
+    def _reserve(self, height: float) -> None:
+        """Starts a new page if `height` doesn't fit above the bottom margin."""
+        if self.y - height < self._BOTTOM_Y:
+            self.canvas.showPage()
+            self.y = self._TOP_Y
+            self._draw_footer()
+
+    def _wrap_style(
+        self, alignment: Alignment, font_style: FontStyle, font_size: float
+    ) -> ParagraphStyle:
+        key = (alignment, font_style, font_size)
+        if key not in self._wrap_styles:
+            self._wrap_styles[key] = ParagraphStyle(
+                f"fast_{alignment.value}_{font_style.value}_{font_size}",
+                fontName=FONT_MAP[font_style],
+                fontSize=font_size,
+                leading=LEADING,
+                alignment=ALIGN_MAP[alignment],
             )
+        return self._wrap_styles[key]
+
+    def _draw_underline(
+        self, x: float, baseline: float, width: float, font_size: float
+    ) -> None:
+        # Same placement as Paragraph's <u> markup
+        y = baseline - 0.125 * font_size
+        self.canvas.line(x, y, x + width, y)
+
+    def spacer(self, height: float, base_height: float = LEADING) -> None:
+        """Moves the cursor down, like a Platypus Spacer."""
+        self._reserve(base_height * height)
+        self.y -= base_height * height
+
+    def text(
+        self,
+        text: str,
+        alignment: Alignment = Alignment.LEFT,
+        font_style: FontStyle = FontStyle.BASE,
+        font_size: float = 12,
+        underline: bool = False,
+    ) -> None:
+        """Draws a single line of text, falling back to a Paragraph if it has to wrap."""
+        font = FONT_MAP[font_style]
+        width = pdfmetrics.stringWidth(text, font, font_size)
+        if width > self._TEXT_WIDTH:
+            self.paragraph(
+                f"<u>{text}</u>" if underline else text,
+                alignment,
+                font_style,
+                font_size,
+            )
+            return
+
+        self._reserve(LEADING)
+        baseline = self.y - font_size
+        self.canvas.setFont(font, font_size)
+        if alignment == Alignment.RIGHT:
+            x = self._RIGHT_X - width
+        elif alignment == Alignment.CENTER:
+            x = self._CENTER_X - width / 2
+        else:
+            x = self._LEFT_X
+        self.canvas.drawString(x, baseline, text)
+        if underline:
+            self._draw_underline(x, baseline, width, font_size)
+        self.y -= LEADING
+
+    def paragraph(
+        self,
+        text: str,
+        alignment: Alignment = Alignment.LEFT,
+        font_style: FontStyle = FontStyle.BASE,
+        font_size: float = 12,
+    ) -> None:
+        """Draws text that may wrap over several lines."""
+        paragraph = Paragraph(text, self._wrap_style(alignment, font_style, font_size))
+        _, height = paragraph.wrap(self._TEXT_WIDTH, self._TOP_Y - self._BOTTOM_Y)
+        self._reserve(height)
+        paragraph.drawOn(self.canvas, self._LEFT_X, self.y - height)
+        self.y -= height
+
+    def lawyer_title(self, name: str) -> None:
+        """Adds a centered paragraph with the main's lawyer name"""
+        self.text(name, Alignment.CENTER, FontStyle.BOLD, font_size=16)
+        self.spacer(0.3)
+        self.text(_court_title(), Alignment.CENTER, font_size=16)
+
+    def collaborator_title(self, names: list[str]) -> None:
+        """Adds a left-aligned paragraph with the lawyer's collaborators"""
+        self.text(COLLABORATION_HEADING, Alignment.LEFT, FontStyle.ITALIC)
+        for name in names:
+            self.text(name)
+        self.text(_court_title(len(names)))
+
+    def client_address(self, client: Client) -> None:
+        for line in _client_address_lines(client):
+            self.text(line, Alignment.RIGHT, FontStyle.BOLD)
+
+    def place_and_date(self, place: str, date: datetime) -> None:
+        """Adds a date to the document."""
+        self.text(_date_text(place, date), Alignment.RIGHT)
+
+    def invoice_number_rectangle(self, number: str) -> None:
+        """Shows the invoice number in a rectangle of the width of the page."""
+        height = self._INVOICE_BOX_HEIGHT
+        self._reserve(height)
+        bottom = self.y - height
+        font_size = 12
+
+        self.canvas.setLineWidth(1)
+        self.canvas.rect(inch, bottom, AVAILABLE_WIDTH, height)
+        self.canvas.setFont(FONT_BOLD, font_size)
+        self.canvas.drawCentredString(
+            self._CENTER_X,
+            self._cell_baseline(bottom, height, font_size),
+            _invoice_title(number),
         )
+        self.y = bottom
+
+    @staticmethod
+    def _cell_baseline(bottom: float, height: float, font_size: float) -> float:
+        """Baseline of one line of text vertically centered in a table cell."""
+        return bottom + (height + LEADING) / 2 - font_size
+
+    def detail_fees(self) -> None:
+        self.text(FEES_HEADING, font_style=FontStyle.BOLD, underline=True)
         self.spacer(1)
 
-        self.contents.append(
-            Paragraph(
-                "<u>Conformément à nos usages de professions libérales, la présente est payable dès réception</u>",
-                self.style(),
-            )
+        self.text(_hourly_rate_text(self.fees.price), font_style=FontStyle.BOLD)
+        self.spacer(1)
+
+        self.text(SERVICES_HEADING, font_style=FontStyle.BOLD)
+        self.spacer(1)
+
+        rows, total_seconds, ht_price = _compute_fee_summary(self.fees)
+        self.list_fee_table(rows)
+
+        self.spacer(5)
+        self.show_total(total_seconds, ht_price)
+
+    def list_fee_table(self, rows: list[FeeRow]) -> None:
+        """Shows the list of individual fees"""
+        before_width, description_width, time_width, _ = FEE_COL_WIDTHS
+        description_x = inch + before_width + CELL_H_PADDING
+        description_max_width = description_width - 2 * CELL_H_PADDING
+        time_right_x = (
+            inch + before_width + description_width + time_width - CELL_H_PADDING
         )
+        price_right_x = inch + AVAILABLE_WIDTH - CELL_H_PADDING
+        height = self._FEE_ROW_HEIGHT
+        font_size = 12
+
+        for row in rows:
+            self._reserve(height)
+            bottom = self.y - height
+            baseline = self._cell_baseline(bottom, height, font_size)
+            description, duration, price = _fee_cells(row)
+
+            self.canvas.setFont(FONT_BOLD, font_size)
+            if (
+                pdfmetrics.stringWidth(description, FONT_BOLD, font_size)
+                <= description_max_width
+            ):
+                self.canvas.drawString(description_x, baseline, description)
+            else:
+                paragraph = Paragraph(
+                    description,
+                    self._wrap_style(Alignment.LEFT, FontStyle.BOLD, font_size),
+                )
+                _, wrapped_height = paragraph.wrap(description_max_width, height)
+                # Vertically centered on the row, overflowing it like a Table cell
+                paragraph.drawOn(
+                    self.canvas, description_x, bottom + (height - wrapped_height) / 2
+                )
+                self.canvas.setFont(FONT_BOLD, font_size)
+            self.canvas.drawRightString(time_right_x, baseline, duration)
+            self.canvas.drawRightString(price_right_x, baseline, price)
+            self.y = bottom
+
+    def show_total(self, total_seconds: float, ht_price: float) -> None:
+        """Shows the total of the fees in a 4-row table."""
+        rows = _total_rows(total_seconds, ht_price)
+        label_x = inch + TOTAL_COL_WIDTHS[0] + CELL_H_PADDING
+        value_right_x = inch + AVAILABLE_WIDTH - CELL_H_PADDING
+        height = self._TOTAL_ROW_HEIGHT
+        font_size = 12
+
+        for index, (label, value) in enumerate(rows):
+            self._reserve(height)
+            bottom = self.y - height
+            baseline = self._cell_baseline(bottom, height, font_size)
+
+            if index == len(rows) - 1:
+                self.canvas.setFillColor(lightgrey)
+                self.canvas.rect(
+                    inch, bottom, AVAILABLE_WIDTH, height, stroke=0, fill=1
+                )
+                self.canvas.setFillColor(black)
+
+            self.canvas.setFont(FONT_BOLD, font_size)
+            self.canvas.drawString(label_x, baseline, label)
+            if index == 0:
+                label_width = pdfmetrics.stringWidth(label, FONT_BOLD, font_size)
+                self._draw_underline(label_x, baseline, label_width, font_size)
+            self.canvas.drawRightString(value_right_x, baseline, value)
+            self.y = bottom
+
+    def final(self) -> None:
+        self.text(VAT_NOTICE, font_style=FontStyle.ITALIC)
+        self.text(PAYMENT_REQUEST, font_style=FontStyle.BOLD)
+        self.spacer(1)
 
+        self.paragraph(PAYMENT_TERMS)
 
-if __name__ == "__main__":
+
+def _render_one(job: InvoiceJob) -> str:
+    """Renders a single invoice in a worker process and returns its path."""
+    output_path, client, lawfirm, fees = job
+    PDFInvoiceWriter(output_path, client, lawfirm, fees).build()
+    return output_path
+
+
+def render_many(jobs: list[InvoiceJob], max_workers: int | None = None) -> list[str]:
+    """Renders several invoices in parallel, one process per CPU by default.
+
+    ReportLab layout is CPU-bound, so processes sidestep the GIL. Fonts are
+    registered lazily, once in each worker.
+    """
+    # Imported here so that importing this module doesn't pull in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_render_one, jobs))
+
+
+def sample_invoice() -> tuple[Client, LawFirm, Fees]:
+    """Returns the example client, law firm and fees used by the demo script."""
     client = Client(
         name="John DOE",
         gender="M",
@@ -456,6 +932,11 @@ if __name__ == "__main__":
         ],
         price=300,
     )
+    return client, lawfirm, fees
+
+
+if __name__ == "__main__":
+    client, lawfirm, fees = sample_invoice()
     writer = PDFInvoiceWriter(
         output_path="invoice.pdf", client=client, lawfirm=lawfirm, fees=fees
     )